@@ -25,7 +25,7 @@ if __name__ == "__main__":
         while True:
             data = yield
             print(".", end="", flush=True)
-            buffer_chunks.append(data)
+            buffer_chunks.append(bytes(data))       # copy it, the captured data buffer is reused
 
     selected_device = choose_device()
     capture = miniaudio.CaptureDevice(buffersize_msec=1000, sample_rate=44100, device_id=selected_device["id"])
@@ -13,12 +13,13 @@ import sys
 import os
 import io
 import array
+import asyncio
+import concurrent.futures
 import urllib.request
-import inspect
 import time
 import threading
 from enum import Enum
-from typing import Generator, List, Dict, Set, Optional, Union, Any, Callable
+from typing import Generator, List, Dict, Set, Optional, Tuple, Union, Any, Callable
 from _miniaudio import ffi, lib
 try:
     import numpy
@@ -27,6 +28,15 @@ except ImportError:
 
 lib.init_miniaudio()
 
+_FS_ENCODING = sys.getfilesystemencoding()
+
+# When set to True (and numpy is installed), the various read functions return
+# their samples as a numpy ndarray instead of an array.array.  The ndarray is
+# created straight from the decoded C memory with a single bulk copy.
+use_numpy_samples = False
+
+_NUMPY_DTYPE_FROM_WIDTH = {1: numpy.uint8, 2: numpy.int16, 4: numpy.int32} if numpy else {}
+
 
 class FileFormat(Enum):
     """Audio file format"""
@@ -107,20 +117,41 @@ class SeekOrigin(Enum):
 
 
 PlaybackCallbackGeneratorType = Generator[Union[bytes, array.array], int, None]
-CaptureCallbackGeneratorType = Generator[None, Union[bytes, array.array], None]
-DuplexCallbackGeneratorType = Generator[Union[bytes, array.array], Union[bytes, array.array], None]
+PlaybackWriteCallbackGeneratorType = Generator[None, Tuple[memoryview, int], None]
+CaptureCallbackGeneratorType = Generator[None, Union[bytes, array.array, memoryview], None]
+DuplexCallbackGeneratorType = Generator[Union[bytes, array.array], Union[bytes, array.array, memoryview, None], None]
 GeneratorTypes = Union[PlaybackCallbackGeneratorType, CaptureCallbackGeneratorType, DuplexCallbackGeneratorType]
 
 
+# there's only a handful of sample formats, so resolve their names once instead of per instance
+_SAMPLE_FORMAT_NAMES = {fmt: ffi.string(lib.ma_get_format_name(fmt.value)).decode()
+                        for fmt in SampleFormat}        # type: Dict[SampleFormat, str]
+
+_FORMAT_NAME_CACHE = {fmt.value: name for fmt, name in _SAMPLE_FORMAT_NAMES.items()}    # type: Dict[int, str]
+
+
+def _format_name(ma_format: int) -> str:
+    # cached name lookup for a raw ma_format value, to avoid a string decode per device format
+    try:
+        return _FORMAT_NAME_CACHE[ma_format]
+    except KeyError:
+        name = ffi.string(lib.ma_get_format_name(ma_format)).decode()
+        _FORMAT_NAME_CACHE[ma_format] = name
+        return name
+
+
 class SoundFileInfo:
     """Contains various properties of an audio file."""
+    __slots__ = ("name", "nchannels", "sample_rate", "sample_format", "sample_format_name",
+                 "sample_width", "num_frames", "duration", "file_format")
+
     def __init__(self, name: str, file_format: FileFormat, nchannels: int, sample_rate: int,
                  sample_format: SampleFormat, duration: float, num_frames: int) -> None:
         self.name = name
         self.nchannels = nchannels
         self.sample_rate = sample_rate
         self.sample_format = sample_format
-        self.sample_format_name = ffi.string(lib.ma_get_format_name(sample_format.value)).decode()
+        self.sample_format_name = _SAMPLE_FORMAT_NAMES[sample_format]
         self.sample_width = width_from_format(sample_format)
         self.num_frames = num_frames
         self.duration = duration
@@ -128,7 +159,10 @@ class SoundFileInfo:
 
     def __str__(self) -> str:
         return "<{clazz}: '{name}' {nchannels} ch, {sample_rate} hz, {sample_format.name}, " \
-               "{num_frames} frames={duration:.2f} sec.>".format(clazz=self.__class__.__name__, **(vars(self)))
+               "{num_frames} frames={duration:.2f} sec.>".format(
+                   clazz=self.__class__.__name__, name=self.name, nchannels=self.nchannels,
+                   sample_rate=self.sample_rate, sample_format=self.sample_format,
+                   num_frames=self.num_frames, duration=self.duration)
 
     def __repr__(self) -> str:
         return str(self)
@@ -136,6 +170,8 @@ class SoundFileInfo:
 
 class DecodedSoundFile(SoundFileInfo):
     """Contains various properties and also the PCM frames of a fully decoded audio file."""
+    __slots__ = ("samples",)
+
     def __init__(self, name: str, nchannels: int, sample_rate: int,
                  sample_format: SampleFormat, samples: array.array) -> None:
         num_frames = len(samples) // nchannels
@@ -157,15 +193,10 @@ class DecodeError(MiniaudioError):
 def get_file_info(filename: str) -> SoundFileInfo:
     """Fetch some information about the audio file."""
     ext = os.path.splitext(filename)[1].lower()
-    if ext in (".ogg", ".vorbis"):
-        return vorbis_get_file_info(filename)
-    elif ext == ".mp3":
-        return mp3_get_file_info(filename)
-    elif ext == ".flac":
-        return flac_get_file_info(filename)
-    elif ext == ".wav":
-        return wav_get_file_info(filename)
-    raise DecodeError("unsupported file format")
+    get_info = _FILE_INFO_DISPATCH.get(ext)
+    if not get_info:
+        raise DecodeError("unsupported file format")
+    return get_info(filename)
 
 
 def read_file(filename: str, convert_to_16bit: bool = False) -> DecodedSoundFile:
@@ -174,54 +205,76 @@ def read_file(filename: str, convert_to_16bit: bool = False) -> DecodedSoundFile
     Unless you set convert_convert_to_16bit to True, then the result is always a 16 bit sample format.
     """
     ext = os.path.splitext(filename)[1].lower()
-
-    if ext in (".ogg", ".vorbis"):
-        if convert_to_16bit:
-            return vorbis_read_file(filename)
-        else:
-            vorbis = vorbis_get_file_info(filename)
-            if vorbis.sample_format == SampleFormat.SIGNED16:
-                return vorbis_read_file(filename)
-            else:
-                raise MiniaudioError("file has sample format that must be converted")
-    elif ext == ".mp3":
-        if convert_to_16bit:
-            return mp3_read_file_s16(filename)
-        else:
-            mp3 = mp3_get_file_info(filename)
-            if mp3.sample_format == SampleFormat.SIGNED16:
-                return mp3_read_file_s16(filename)
-            elif mp3.sample_format == SampleFormat.FLOAT32:
-                return mp3_read_file_f32(filename)
-            else:
-                raise MiniaudioError("file has sample format that must be converted")
-    elif ext == ".flac":
-        if convert_to_16bit:
-            return flac_read_file_s16(filename)
-        else:
-            flac = flac_get_file_info(filename)
-            if flac.sample_format == SampleFormat.SIGNED16:
-                return flac_read_file_s16(filename)
-            elif flac.sample_format == SampleFormat.SIGNED32:
-                return flac_read_file_s32(filename)
-            elif flac.sample_format == SampleFormat.FLOAT32:
-                return flac_read_file_f32(filename)
-            else:
-                raise MiniaudioError("file has sample format that must be converted")
-    elif ext == ".wav":
-        if convert_to_16bit:
-            return wav_read_file_s16(filename)
-        else:
-            wav = wav_get_file_info(filename)
-            if wav.sample_format == SampleFormat.SIGNED16:
-                return wav_read_file_s16(filename)
-            elif wav.sample_format == SampleFormat.SIGNED32:
-                return wav_read_file_s32(filename)
-            elif wav.sample_format == SampleFormat.FLOAT32:
-                return wav_read_file_f32(filename)
-            else:
-                raise MiniaudioError("file has sample format that must be converted")
-    raise DecodeError("unsupported file format")
+    read = _FILE_READ_DISPATCH.get(ext)
+    if not read:
+        raise DecodeError("unsupported file format")
+    return read(filename, convert_to_16bit)
+
+
+def read_files(filenames: List[str], convert_to_16bit: bool = False,
+               max_workers: Optional[int] = None) -> List[DecodedSoundFile]:
+    """Reads and decodes multiple audio files concurrently, using a thread pool.
+    The decoding itself happens in C code that releases the GIL, so decoding many
+    files this way can use multiple cpu cores.
+    The decoded files are returned in the same order as the given filenames."""
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(lambda filename: read_file(filename, convert_to_16bit), filenames))
+
+
+async def read_files_async(filenames: List[str], convert_to_16bit: bool = False) -> List[DecodedSoundFile]:
+    """Reads and decodes multiple audio files concurrently, from an asyncio program.
+    The file I/O and decoding run on worker threads (the C decode calls release the GIL)
+    so the event loop stays responsive while a batch of files is being decoded.
+    The decoded files are returned in the same order as the given filenames."""
+    loop = asyncio.get_event_loop()
+    return await asyncio.gather(*(loop.run_in_executor(None, read_file, filename, convert_to_16bit)
+                                  for filename in filenames))
+
+
+def _read_vorbis_file(filename: str, convert_to_16bit: bool) -> DecodedSoundFile:
+    if convert_to_16bit:
+        return vorbis_read_file(filename)
+    vorbis = vorbis_get_file_info(filename)
+    if vorbis.sample_format == SampleFormat.SIGNED16:
+        return vorbis_read_file(filename)
+    raise MiniaudioError("file has sample format that must be converted")
+
+
+def _read_mp3_file(filename: str, convert_to_16bit: bool) -> DecodedSoundFile:
+    if convert_to_16bit:
+        return mp3_read_file_s16(filename)
+    mp3 = mp3_get_file_info(filename)
+    if mp3.sample_format == SampleFormat.SIGNED16:
+        return mp3_read_file_s16(filename)
+    elif mp3.sample_format == SampleFormat.FLOAT32:
+        return mp3_read_file_f32(filename)
+    raise MiniaudioError("file has sample format that must be converted")
+
+
+def _read_flac_file(filename: str, convert_to_16bit: bool) -> DecodedSoundFile:
+    if convert_to_16bit:
+        return flac_read_file_s16(filename)
+    flac = flac_get_file_info(filename)
+    if flac.sample_format == SampleFormat.SIGNED16:
+        return flac_read_file_s16(filename)
+    elif flac.sample_format == SampleFormat.SIGNED32:
+        return flac_read_file_s32(filename)
+    elif flac.sample_format == SampleFormat.FLOAT32:
+        return flac_read_file_f32(filename)
+    raise MiniaudioError("file has sample format that must be converted")
+
+
+def _read_wav_file(filename: str, convert_to_16bit: bool) -> DecodedSoundFile:
+    if convert_to_16bit:
+        return wav_read_file_s16(filename)
+    wav = wav_get_file_info(filename)
+    if wav.sample_format == SampleFormat.SIGNED16:
+        return wav_read_file_s16(filename)
+    elif wav.sample_format == SampleFormat.SIGNED32:
+        return wav_read_file_s32(filename)
+    elif wav.sample_format == SampleFormat.FLOAT32:
+        return wav_read_file_f32(filename)
+    raise MiniaudioError("file has sample format that must be converted")
 
 
 def vorbis_get_file_info(filename: str) -> SoundFileInfo:
@@ -230,7 +283,7 @@ def vorbis_get_file_info(filename: str) -> SoundFileInfo:
     with ffi.new("int *") as error:
         vorbis = lib.stb_vorbis_open_filename(filenamebytes, error, ffi.NULL)
         if not vorbis:
-            raise DecodeError("could not open/decode file")
+            raise _file_decode_error(filename, "could not open/decode file")
         try:
             info = lib.stb_vorbis_get_info(vorbis)
             duration = lib.stb_vorbis_stream_length_in_seconds(vorbis)
@@ -259,15 +312,18 @@ def vorbis_get_info(data: bytes) -> SoundFileInfo:
 
 def vorbis_read_file(filename: str) -> DecodedSoundFile:
     """Reads and decodes the whole vorbis audio file. Resulting sample format is 16 bits signed integer."""
+    data = _read_filedata(filename)
+    if data is not None:
+        sound = vorbis_read(data)
+        sound.name = filename
+        return sound
     filenamebytes = _get_filename_bytes(filename)
     with ffi.new("int *") as channels, ffi.new("int *") as sample_rate, ffi.new("short **") as output:
         num_frames = lib.stb_vorbis_decode_filename(filenamebytes, channels, sample_rate, output)
         if num_frames <= 0:
-            raise DecodeError("cannot load/decode file")
+            raise _file_decode_error(filename, "cannot load/decode file")
         try:
-            buffer = ffi.buffer(output[0], num_frames * channels[0] * 2)
-            samples = _create_int_array(2)
-            samples.frombytes(buffer)
+            samples = _samples_from_cdata(output[0], num_frames * channels[0] * 2, 2)
             return DecodedSoundFile(filename, channels[0], sample_rate[0], SampleFormat.SIGNED16, samples)
         finally:
             lib.free(output[0])
@@ -280,9 +336,7 @@ def vorbis_read(data: bytes) -> DecodedSoundFile:
         if num_samples <= 0:
             raise DecodeError("cannot load/decode data")
         try:
-            buffer = ffi.buffer(output[0], num_samples * channels[0] * 2)
-            samples = _create_int_array(2)
-            samples.frombytes(buffer)
+            samples = _samples_from_cdata(output[0], num_samples * channels[0] * 2, 2)
             return DecodedSoundFile("<memory>", channels[0], sample_rate[0], SampleFormat.SIGNED16, samples)
         finally:
             lib.free(output[0])
@@ -296,42 +350,97 @@ def vorbis_stream_file(filename: str, seek_frame: int = 0) -> Generator[array.ar
     with ffi.new("int *") as error:
         vorbis = lib.stb_vorbis_open_filename(filenamebytes, error, ffi.NULL)
         if not vorbis:
-            raise DecodeError("could not open/decode file")
+            raise _file_decode_error(filename, "could not open/decode file")
         try:
             info = lib.stb_vorbis_get_info(vorbis)
-            with ffi.new("short[]", 4096 * info.channels) as decode_buffer1, \
-                ffi.new("short[]", 4096 * info.channels) as decode_buffer2:
-                decodebuf_ptr1 = ffi.cast("short *", decode_buffer1)
-                decodebuf_ptr2 = ffi.cast("short *", decode_buffer2)
+            with ffi.new("short[]", 4096 * info.channels) as decode_buffer:
+                decodebuf_ptr = ffi.cast("short *", decode_buffer)
+                buf_view = memoryview(ffi.buffer(decode_buffer))
+                samples_proto = _create_int_array(2)
                 if seek_frame > 0:
                     result = lib.stb_vorbis_seek_frame(vorbis, seek_frame)
                     if result <= 0:
                         raise DecodeError("can't seek")
-                # note: we decode several frames to reduce the overhead of very small sample sizes a little
+                read_frame = lib.stb_vorbis_get_frame_short_interleaved
                 while True:
-                    num_samples1 = lib.stb_vorbis_get_frame_short_interleaved(vorbis, info.channels, decodebuf_ptr1,
-                                                                              4096 * info.channels)
-                    num_samples2 = lib.stb_vorbis_get_frame_short_interleaved(vorbis, info.channels, decodebuf_ptr2,
-                                                                              4096 * info.channels)
-                    if num_samples1 + num_samples2 <= 0:
+                    num_samples = read_frame(vorbis, info.channels, decodebuf_ptr, 4096 * info.channels)
+                    if num_samples <= 0:
                         break
-                    buffer = ffi.buffer(decode_buffer1, num_samples1 * 2 * info.channels)
-                    samples = _create_int_array(2)
-                    samples.frombytes(buffer)
-                    if num_samples2 > 0:
-                        buffer = ffi.buffer(decode_buffer2, num_samples2 * 2 * info.channels)
-                        samples.frombytes(buffer)
+                    samples = array.array(samples_proto.typecode)
+                    samples.frombytes(buf_view[:num_samples * 2 * info.channels])
                     yield samples
         finally:
             lib.stb_vorbis_close(vorbis)
 
 
+def _dr_read_file(open_fn: Callable, free_fn: Callable, filename: str, itemsize: int,
+                  sample_format: SampleFormat, float_samples: bool = False) -> DecodedSoundFile:
+    """Decodes a whole audio file with a dr_flac/dr_wav style open_file_and_read function."""
+    filenamebytes = _get_filename_bytes(filename)
+    with ffi.new("unsigned int *") as channels, \
+        ffi.new("unsigned int *") as sample_rate, \
+        ffi.new("unsigned long long *") as num_frames:
+        memory = open_fn(filenamebytes, channels, sample_rate, num_frames, ffi.NULL)
+        if not memory:
+            raise _file_decode_error(filename, "cannot load/decode file")
+        try:
+            samples = _samples_from_cdata(memory, num_frames[0] * channels[0] * itemsize, itemsize, float_samples)
+            return DecodedSoundFile(filename, channels[0], sample_rate[0], sample_format, samples)
+        finally:
+            free_fn(memory, ffi.NULL)
+
+
+def _dr_read_memory(open_fn: Callable, free_fn: Callable, data: bytes, itemsize: int,
+                    sample_format: SampleFormat, float_samples: bool = False) -> DecodedSoundFile:
+    """Decodes whole audio data with a dr_flac/dr_wav style open_memory_and_read function."""
+    with ffi.new("unsigned int *") as channels, \
+        ffi.new("unsigned int *") as sample_rate, \
+        ffi.new("unsigned long long *") as num_frames:
+        memory = open_fn(data, len(data), channels, sample_rate, num_frames, ffi.NULL)
+        if not memory:
+            raise DecodeError("cannot load/decode data")
+        try:
+            samples = _samples_from_cdata(memory, num_frames[0] * channels[0] * itemsize, itemsize, float_samples)
+            return DecodedSoundFile("<memory>", channels[0], sample_rate[0], sample_format, samples)
+        finally:
+            free_fn(memory, ffi.NULL)
+
+
+def _mp3_read_file(open_fn: Callable, filename: str, itemsize: int,
+                   sample_format: SampleFormat, float_samples: bool = False) -> DecodedSoundFile:
+    """Decodes a whole mp3 file with a dr_mp3 style open_file_and_read function."""
+    filenamebytes = _get_filename_bytes(filename)
+    with ffi.new("drmp3_config *") as config, ffi.new("drmp3_uint64 *") as num_frames:
+        memory = open_fn(filenamebytes, config, num_frames, ffi.NULL)
+        if not memory:
+            raise _file_decode_error(filename, "cannot load/decode file")
+        try:
+            samples = _samples_from_cdata(memory, num_frames[0] * config.channels * itemsize, itemsize, float_samples)
+            return DecodedSoundFile(filename, config.channels, config.sampleRate, sample_format, samples)
+        finally:
+            lib.drmp3_free(memory, ffi.NULL)
+
+
+def _mp3_read_memory(open_fn: Callable, data: bytes, itemsize: int,
+                     sample_format: SampleFormat, float_samples: bool = False) -> DecodedSoundFile:
+    """Decodes whole mp3 data with a dr_mp3 style open_memory_and_read function."""
+    with ffi.new("drmp3_config *") as config, ffi.new("drmp3_uint64 *") as num_frames:
+        memory = open_fn(data, len(data), config, num_frames, ffi.NULL)
+        if not memory:
+            raise DecodeError("cannot load/decode data")
+        try:
+            samples = _samples_from_cdata(memory, num_frames[0] * config.channels * itemsize, itemsize, float_samples)
+            return DecodedSoundFile("<memory>", config.channels, config.sampleRate, sample_format, samples)
+        finally:
+            lib.drmp3_free(memory, ffi.NULL)
+
+
 def flac_get_file_info(filename: str) -> SoundFileInfo:
     """Fetch some information about the audio file (flac format)."""
     filenamebytes = _get_filename_bytes(filename)
     flac = lib.drflac_open_file(filenamebytes, ffi.NULL)
     if not flac:
-        raise DecodeError("could not open/decode file")
+        raise _file_decode_error(filename, "could not open/decode file")
     try:
         duration = flac.totalPCMFrameCount / flac.sampleRate
         sample_width = flac.bitsPerSample // 8
@@ -357,110 +466,47 @@ def flac_get_info(data: bytes) -> SoundFileInfo:
 
 def flac_read_file_s32(filename: str) -> DecodedSoundFile:
     """Reads and decodes the whole flac audio file. Resulting sample format is 32 bits signed integer."""
-    filenamebytes = _get_filename_bytes(filename)
-    with ffi.new("unsigned int *") as channels, \
-        ffi.new("unsigned int *") as sample_rate, \
-        ffi.new("drflac_uint64 *") as num_frames:
-        memory = lib.drflac_open_file_and_read_pcm_frames_s32(filenamebytes, channels, sample_rate, num_frames, ffi.NULL)
-        if not memory:
-            raise DecodeError("cannot load/decode file")
-        try:
-            samples = _create_int_array(4)
-            buffer = ffi.buffer(memory, num_frames[0] * channels[0] * 4)
-            samples.frombytes(buffer)
-            return DecodedSoundFile(filename, channels[0], sample_rate[0], SampleFormat.SIGNED32, samples)
-        finally:
-            lib.drflac_free(memory, ffi.NULL)
+    data = _read_filedata(filename)
+    if data is not None:
+        sound = flac_read_s32(data)
+        sound.name = filename
+        return sound
+    return _dr_read_file(lib.drflac_open_file_and_read_pcm_frames_s32, lib.drflac_free, filename, 4, SampleFormat.SIGNED32)
 
 
 def flac_read_file_s16(filename: str) -> DecodedSoundFile:
     """Reads and decodes the whole flac audio file. Resulting sample format is 16 bits signed integer."""
-    filenamebytes = _get_filename_bytes(filename)
-    with ffi.new("unsigned int *") as channels, \
-        ffi.new("unsigned int *") as sample_rate, \
-        ffi.new("drflac_uint64 *") as num_frames:
-        memory = lib.drflac_open_file_and_read_pcm_frames_s16(filenamebytes, channels, sample_rate, num_frames, ffi.NULL)
-        if not memory:
-            raise DecodeError("cannot load/decode file")
-        try:
-            samples = _create_int_array(2)
-            buffer = ffi.buffer(memory, num_frames[0] * channels[0] * 2)
-            samples.frombytes(buffer)
-            return DecodedSoundFile(filename, channels[0], sample_rate[0], SampleFormat.SIGNED16, samples)
-        finally:
-            lib.drflac_free(memory, ffi.NULL)
+    data = _read_filedata(filename)
+    if data is not None:
+        sound = flac_read_s16(data)
+        sound.name = filename
+        return sound
+    return _dr_read_file(lib.drflac_open_file_and_read_pcm_frames_s16, lib.drflac_free, filename, 2, SampleFormat.SIGNED16)
 
 
 def flac_read_file_f32(filename: str) -> DecodedSoundFile:
     """Reads and decodes the whole flac audio file. Resulting sample format is 32 bits float."""
-    filenamebytes = _get_filename_bytes(filename)
-    with ffi.new("unsigned int *") as channels, \
-        ffi.new("unsigned int *") as sample_rate, \
-        ffi.new("drflac_uint64 *") as num_frames:
-        memory = lib.drflac_open_file_and_read_pcm_frames_f32(filenamebytes, channels, sample_rate, num_frames, ffi.NULL)
-        if not memory:
-            raise DecodeError("cannot load/decode file")
-        try:
-            samples = array.array('f')
-            buffer = ffi.buffer(memory, num_frames[0] * channels[0] * 4)
-            samples.frombytes(buffer)
-            return DecodedSoundFile(filename, channels[0], sample_rate[0], SampleFormat.FLOAT32, samples)
-        finally:
-            lib.drflac_free(memory, ffi.NULL)
+    data = _read_filedata(filename)
+    if data is not None:
+        sound = flac_read_f32(data)
+        sound.name = filename
+        return sound
+    return _dr_read_file(lib.drflac_open_file_and_read_pcm_frames_f32, lib.drflac_free, filename, 4, SampleFormat.FLOAT32, float_samples=True)
 
 
 def flac_read_s32(data: bytes) -> DecodedSoundFile:
     """Reads and decodes the whole flac audio data. Resulting sample format is 32 bits signed integer."""
-    with ffi.new("unsigned int *") as channels, \
-        ffi.new("unsigned int *") as sample_rate, \
-        ffi.new("drflac_uint64 *") as num_frames:
-        memory = lib.drflac_open_memory_and_read_pcm_frames_s32(data, len(data),
-                                                                channels, sample_rate, num_frames, ffi.NULL)
-        if not memory:
-            raise DecodeError("cannot load/decode data")
-        try:
-            samples = _create_int_array(4)
-            buffer = ffi.buffer(memory, num_frames[0] * channels[0] * 4)
-            samples.frombytes(buffer)
-            return DecodedSoundFile("<memory>", channels[0], sample_rate[0], SampleFormat.SIGNED32, samples)
-        finally:
-            lib.drflac_free(memory, ffi.NULL)
+    return _dr_read_memory(lib.drflac_open_memory_and_read_pcm_frames_s32, lib.drflac_free, data, 4, SampleFormat.SIGNED32)
 
 
 def flac_read_s16(data: bytes) -> DecodedSoundFile:
     """Reads and decodes the whole flac audio data. Resulting sample format is 16 bits signed integer."""
-    with ffi.new("unsigned int *") as channels, \
-        ffi.new("unsigned int *") as sample_rate, \
-        ffi.new("drflac_uint64 *") as num_frames:
-        memory = lib.drflac_open_memory_and_read_pcm_frames_s16(data, len(data),
-                                                                channels, sample_rate, num_frames, ffi.NULL)
-        if not memory:
-            raise DecodeError("cannot load/decode data")
-        try:
-            samples = _create_int_array(2)
-            buffer = ffi.buffer(memory, num_frames[0] * channels[0] * 2)
-            samples.frombytes(buffer)
-            return DecodedSoundFile("<memory>", channels[0], sample_rate[0], SampleFormat.SIGNED16, samples)
-        finally:
-            lib.drflac_free(memory, ffi.NULL)
+    return _dr_read_memory(lib.drflac_open_memory_and_read_pcm_frames_s16, lib.drflac_free, data, 2, SampleFormat.SIGNED16)
 
 
 def flac_read_f32(data: bytes) -> DecodedSoundFile:
     """Reads and decodes the whole flac audio file. Resulting sample format is 32 bits float."""
-    with ffi.new("unsigned int *") as channels, \
-        ffi.new("unsigned int *") as sample_rate, \
-        ffi.new("drflac_uint64 *") as num_frames:
-        memory = lib.drflac_open_memory_and_read_pcm_frames_f32(data, len(data),
-                                                                channels, sample_rate, num_frames, ffi.NULL)
-        if not memory:
-            raise DecodeError("cannot load/decode data")
-        try:
-            samples = array.array('f')
-            buffer = ffi.buffer(memory, num_frames[0] * channels[0] * 4)
-            samples.frombytes(buffer)
-            return DecodedSoundFile("<memory>", channels[0], sample_rate[0], SampleFormat.FLOAT32, samples)
-        finally:
-            lib.drflac_free(memory, ffi.NULL)
+    return _dr_read_memory(lib.drflac_open_memory_and_read_pcm_frames_f32, lib.drflac_free, data, 4, SampleFormat.FLOAT32, float_samples=True)
 
 
 def flac_stream_file(filename: str, frames_to_read: int = 1024,
@@ -471,7 +517,7 @@ def flac_stream_file(filename: str, frames_to_read: int = 1024,
     filenamebytes = _get_filename_bytes(filename)
     flac = lib.drflac_open_file(filenamebytes, ffi.NULL)
     if not flac:
-        raise DecodeError("could not open/decode file")
+        raise _file_decode_error(filename, "could not open/decode file")
     if seek_frame > 0:
         result = lib.drflac_seek_to_pcm_frame(flac, seek_frame)
         if result <= 0:
@@ -479,13 +525,15 @@ def flac_stream_file(filename: str, frames_to_read: int = 1024,
     try:
         with ffi.new("drflac_int16[]", frames_to_read * flac.channels) as decodebuffer:
             buf_ptr = ffi.cast("drflac_int16 *", decodebuffer)
+            buf_view = memoryview(ffi.buffer(decodebuffer))
+            samples_proto = _create_int_array(2)
+            read_frames = lib.drflac_read_pcm_frames_s16
             while True:
-                num_samples = lib.drflac_read_pcm_frames_s16(flac, frames_to_read, buf_ptr)
+                num_samples = read_frames(flac, frames_to_read, buf_ptr)
                 if num_samples <= 0:
                     break
-                buffer = ffi.buffer(decodebuffer, num_samples * 2 * flac.channels)
-                samples = _create_int_array(2)
-                samples.frombytes(buffer)
+                samples = array.array(samples_proto.typecode)
+                samples.frombytes(buf_view[:num_samples * 2 * flac.channels])
                 yield samples
     finally:
         lib.drflac_close(flac)
@@ -496,7 +544,7 @@ def mp3_get_file_info(filename: str) -> SoundFileInfo:
     filenamebytes = _get_filename_bytes(filename)
     with ffi.new("drmp3 *") as mp3:
         if not lib.drmp3_init_file(mp3, filenamebytes, ffi.NULL):
-            raise DecodeError("could not open/decode file")
+            raise _file_decode_error(filename, "could not open/decode file")
         try:
             num_frames = lib.drmp3_get_pcm_frame_count(mp3)
             duration = num_frames / mp3.sampleRate
@@ -522,64 +570,32 @@ def mp3_get_info(data: bytes) -> SoundFileInfo:
 
 def mp3_read_file_f32(filename: str) -> DecodedSoundFile:
     """Reads and decodes the whole mp3 audio file. Resulting sample format is 32 bits float."""
-    filenamebytes = _get_filename_bytes(filename)
-    with ffi.new("drmp3_config *") as config, ffi.new("drmp3_uint64 *") as num_frames:
-        memory = lib.drmp3_open_file_and_read_pcm_frames_f32(filenamebytes, config, num_frames, ffi.NULL)
-        if not memory:
-            raise DecodeError("cannot load/decode file")
-        try:
-            samples = array.array('f')
-            buffer = ffi.buffer(memory, num_frames[0] * config.channels * 4)
-            samples.frombytes(buffer)
-            return DecodedSoundFile(filename, config.channels, config.sampleRate, SampleFormat.FLOAT32, samples)
-        finally:
-            lib.drmp3_free(memory, ffi.NULL)
+    data = _read_filedata(filename)
+    if data is not None:
+        sound = mp3_read_f32(data)
+        sound.name = filename
+        return sound
+    return _mp3_read_file(lib.drmp3_open_file_and_read_pcm_frames_f32, filename, 4, SampleFormat.FLOAT32, float_samples=True)
 
 
 def mp3_read_file_s16(filename: str) -> DecodedSoundFile:
     """Reads and decodes the whole mp3 audio file. Resulting sample format is 16 bits signed integer."""
-    filenamebytes = _get_filename_bytes(filename)
-    with ffi.new("drmp3_config *") as config, ffi.new("drmp3_uint64 *") as num_frames:
-        memory = lib.drmp3_open_file_and_read_pcm_frames_s16(filenamebytes, config, num_frames, ffi.NULL)
-        if not memory:
-            raise DecodeError("cannot load/decode file")
-        try:
-            samples = _create_int_array(2)
-            buffer = ffi.buffer(memory, num_frames[0] * config.channels * 2)
-            samples.frombytes(buffer)
-            return DecodedSoundFile(filename, config.channels, config.sampleRate, SampleFormat.SIGNED16, samples)
-        finally:
-            lib.drmp3_free(memory, ffi.NULL)
+    data = _read_filedata(filename)
+    if data is not None:
+        sound = mp3_read_s16(data)
+        sound.name = filename
+        return sound
+    return _mp3_read_file(lib.drmp3_open_file_and_read_pcm_frames_s16, filename, 2, SampleFormat.SIGNED16)
 
 
 def mp3_read_f32(data: bytes) -> DecodedSoundFile:
     """Reads and decodes the whole mp3 audio data. Resulting sample format is 32 bits float."""
-    with ffi.new("drmp3_config *") as config, ffi.new("drmp3_uint64 *") as num_frames:
-        memory = lib.drmp3_open_memory_and_read_pcm_frames_f32(data, len(data), config, num_frames, ffi.NULL)
-        if not memory:
-            raise DecodeError("cannot load/decode data")
-        try:
-            samples = array.array('f')
-            buffer = ffi.buffer(memory, num_frames[0] * config.channels * 4)
-            samples.frombytes(buffer)
-            return DecodedSoundFile("<memory>", config.channels, config.sampleRate, SampleFormat.FLOAT32, samples)
-        finally:
-            lib.drmp3_free(memory, ffi.NULL)
+    return _mp3_read_memory(lib.drmp3_open_memory_and_read_pcm_frames_f32, data, 4, SampleFormat.FLOAT32, float_samples=True)
 
 
 def mp3_read_s16(data: bytes) -> DecodedSoundFile:
     """Reads and decodes the whole mp3 audio data. Resulting sample format is 16 bits signed integer."""
-    with ffi.new("drmp3_config *") as config, ffi.new("drmp3_uint64 *") as num_frames:
-        memory = lib.drmp3_open_memory_and_read_pcm_frames_s16(data, len(data), config, num_frames, ffi.NULL)
-        if not memory:
-            raise DecodeError("cannot load/decode data")
-        try:
-            samples = _create_int_array(2)
-            buffer = ffi.buffer(memory, num_frames[0] * config.channels * 2)
-            samples.frombytes(buffer)
-            return DecodedSoundFile("<memory>", config.channels, config.sampleRate, SampleFormat.SIGNED16, samples)
-        finally:
-            lib.drmp3_free(memory, ffi.NULL)
+    return _mp3_read_memory(lib.drmp3_open_memory_and_read_pcm_frames_s16, data, 2, SampleFormat.SIGNED16)
 
 
 def mp3_stream_file(filename: str, frames_to_read: int = 1024, seek_frame: int = 0) -> Generator[array.array, None, None]:
@@ -589,7 +605,7 @@ def mp3_stream_file(filename: str, frames_to_read: int = 1024, seek_frame: int =
     filenamebytes = _get_filename_bytes(filename)
     with ffi.new("drmp3 *") as mp3:
         if not lib.drmp3_init_file(mp3, filenamebytes, ffi.NULL):
-            raise DecodeError("could not open/decode file")
+            raise _file_decode_error(filename, "could not open/decode file")
         if seek_frame > 0:
             result = lib.drmp3_seek_to_pcm_frame(mp3, seek_frame)
             if result <= 0:
@@ -597,13 +613,15 @@ def mp3_stream_file(filename: str, frames_to_read: int = 1024, seek_frame: int =
         try:
             with ffi.new("drmp3_int16[]", frames_to_read * mp3.channels) as decodebuffer:
                 buf_ptr = ffi.cast("drmp3_int16 *", decodebuffer)
+                buf_view = memoryview(ffi.buffer(decodebuffer))
+                samples_proto = _create_int_array(2)
+                read_frames = lib.drmp3_read_pcm_frames_s16
                 while True:
-                    num_samples = lib.drmp3_read_pcm_frames_s16(mp3, frames_to_read, buf_ptr)
+                    num_samples = read_frames(mp3, frames_to_read, buf_ptr)
                     if num_samples <= 0:
                         break
-                    buffer = ffi.buffer(decodebuffer, num_samples * 2 * mp3.channels)
-                    samples = _create_int_array(2)
-                    samples.frombytes(buffer)
+                    samples = array.array(samples_proto.typecode)
+                    samples.frombytes(buf_view[:num_samples * 2 * mp3.channels])
                     yield samples
         finally:
             lib.drmp3_uninit(mp3)
@@ -614,7 +632,7 @@ def wav_get_file_info(filename: str) -> SoundFileInfo:
     filenamebytes = _get_filename_bytes(filename)
     with ffi.new("drwav*") as wav:
         if not lib.drwav_init_file(wav, filenamebytes, ffi.NULL):
-            raise DecodeError("could not open/decode file")
+            raise _file_decode_error(filename, "could not open/decode file")
         try:
             duration = wav.totalPCMFrameCount / wav.sampleRate
             sample_width = wav.bitsPerSample // 8
@@ -642,107 +660,47 @@ def wav_get_info(data: bytes) -> SoundFileInfo:
 
 def wav_read_file_s32(filename: str) -> DecodedSoundFile:
     """Reads and decodes the whole wav audio file. Resulting sample format is 32 bits signed integer."""
-    filenamebytes = _get_filename_bytes(filename)
-    with ffi.new("unsigned int *") as channels, \
-        ffi.new("unsigned int *") as sample_rate, \
-        ffi.new("drwav_uint64 *") as num_frames:
-        memory = lib.drwav_open_file_and_read_pcm_frames_s32(filenamebytes, channels, sample_rate, num_frames, ffi.NULL)
-        if not memory:
-            raise DecodeError("cannot load/decode file")
-        try:
-            samples = _create_int_array(4)
-            buffer = ffi.buffer(memory, num_frames[0] * channels[0] * 4)
-            samples.frombytes(buffer)
-            return DecodedSoundFile(filename, channels[0], sample_rate[0], SampleFormat.SIGNED32, samples)
-        finally:
-            lib.drwav_free(memory, ffi.NULL)
+    data = _read_filedata(filename)
+    if data is not None:
+        sound = wav_read_s32(data)
+        sound.name = filename
+        return sound
+    return _dr_read_file(lib.drwav_open_file_and_read_pcm_frames_s32, lib.drwav_free, filename, 4, SampleFormat.SIGNED32)
 
 
 def wav_read_file_s16(filename: str) -> DecodedSoundFile:
     """Reads and decodes the whole wav audio file. Resulting sample format is 16 bits signed integer."""
-    filenamebytes = _get_filename_bytes(filename)
-    with ffi.new("unsigned int *") as channels, \
-        ffi.new("unsigned int *") as sample_rate, \
-        ffi.new("drwav_uint64 *") as num_frames:
-        memory = lib.drwav_open_file_and_read_pcm_frames_s16(filenamebytes, channels, sample_rate, num_frames, ffi.NULL)
-        if not memory:
-            raise DecodeError("cannot load/decode file")
-        try:
-            samples = _create_int_array(2)
-            buffer = ffi.buffer(memory, num_frames[0] * channels[0] * 2)
-            samples.frombytes(buffer)
-            return DecodedSoundFile(filename, channels[0], sample_rate[0], SampleFormat.SIGNED16, samples)
-        finally:
-            lib.drwav_free(memory, ffi.NULL)
+    data = _read_filedata(filename)
+    if data is not None:
+        sound = wav_read_s16(data)
+        sound.name = filename
+        return sound
+    return _dr_read_file(lib.drwav_open_file_and_read_pcm_frames_s16, lib.drwav_free, filename, 2, SampleFormat.SIGNED16)
 
 
 def wav_read_file_f32(filename: str) -> DecodedSoundFile:
     """Reads and decodes the whole wav audio file. Resulting sample format is 32 bits float."""
-    filenamebytes = _get_filename_bytes(filename)
-    with ffi.new("unsigned int *") as channels, \
-        ffi.new("unsigned int *") as sample_rate, \
-        ffi.new("drwav_uint64 *") as num_frames:
-        memory = lib.drwav_open_file_and_read_pcm_frames_f32(filenamebytes, channels, sample_rate, num_frames, ffi.NULL)
-        if not memory:
-            raise DecodeError("cannot load/decode file")
-        try:
-            samples = array.array('f')
-            buffer = ffi.buffer(memory, num_frames[0] * channels[0] * 4)
-            samples.frombytes(buffer)
-            return DecodedSoundFile(filename, channels[0], sample_rate[0], SampleFormat.FLOAT32, samples)
-        finally:
-            lib.drwav_free(memory, ffi.NULL)
+    data = _read_filedata(filename)
+    if data is not None:
+        sound = wav_read_f32(data)
+        sound.name = filename
+        return sound
+    return _dr_read_file(lib.drwav_open_file_and_read_pcm_frames_f32, lib.drwav_free, filename, 4, SampleFormat.FLOAT32, float_samples=True)
 
 
 def wav_read_s32(data: bytes) -> DecodedSoundFile:
     """Reads and decodes the whole wav audio data. Resulting sample format is 32 bits signed integer."""
-    with ffi.new("unsigned int *") as channels, \
-        ffi.new("unsigned int *") as sample_rate, \
-        ffi.new("drwav_uint64 *") as num_frames:
-        memory = lib.drwav_open_memory_and_read_pcm_frames_s32(data, len(data), channels, sample_rate, num_frames, ffi.NULL)
-        if not memory:
-            raise DecodeError("cannot load/decode data")
-        try:
-            samples = _create_int_array(4)
-            buffer = ffi.buffer(memory, num_frames[0] * channels[0] * 4)
-            samples.frombytes(buffer)
-            return DecodedSoundFile("<memory>", channels[0], sample_rate[0], SampleFormat.SIGNED32, samples)
-        finally:
-            lib.drwav_free(memory, ffi.NULL)
+    return _dr_read_memory(lib.drwav_open_memory_and_read_pcm_frames_s32, lib.drwav_free, data, 4, SampleFormat.SIGNED32)
 
 
 def wav_read_s16(data: bytes) -> DecodedSoundFile:
     """Reads and decodes the whole wav audio data. Resulting sample format is 16 bits signed integer."""
-    with ffi.new("unsigned int *") as channels, \
-        ffi.new("unsigned int *") as sample_rate, \
-        ffi.new("drwav_uint64 *") as num_frames:
-        memory = lib.drwav_open_memory_and_read_pcm_frames_s16(data, len(data), channels, sample_rate, num_frames, ffi.NULL)
-        if not memory:
-            raise DecodeError("cannot load/decode data")
-        try:
-            samples = _create_int_array(2)
-            buffer = ffi.buffer(memory, num_frames[0] * channels[0] * 2)
-            samples.frombytes(buffer)
-            return DecodedSoundFile("<memory>", channels[0], sample_rate[0], SampleFormat.SIGNED16, samples)
-        finally:
-            lib.drwav_free(memory, ffi.NULL)
+    return _dr_read_memory(lib.drwav_open_memory_and_read_pcm_frames_s16, lib.drwav_free, data, 2, SampleFormat.SIGNED16)
 
 
 def wav_read_f32(data: bytes) -> DecodedSoundFile:
     """Reads and decodes the whole wav audio data. Resulting sample format is 32 bits float."""
-    with ffi.new("unsigned int *") as channels, \
-        ffi.new("unsigned int *") as sample_rate, \
-        ffi.new("drwav_uint64 *") as num_frames:
-        memory = lib.drwav_open_memory_and_read_pcm_frames_f32(data, len(data), channels, sample_rate, num_frames, ffi.NULL)
-        if not memory:
-            raise DecodeError("cannot load/decode data")
-        try:
-            samples = array.array('f')
-            buffer = ffi.buffer(memory, num_frames[0] * channels[0] * 4)
-            samples.frombytes(buffer)
-            return DecodedSoundFile("<memory>", channels[0], sample_rate[0], SampleFormat.FLOAT32, samples)
-        finally:
-            lib.drwav_free(memory, ffi.NULL)
+    return _dr_read_memory(lib.drwav_open_memory_and_read_pcm_frames_f32, lib.drwav_free, data, 4, SampleFormat.FLOAT32, float_samples=True)
 
 
 def wav_stream_file(filename: str, frames_to_read: int = 1024,
@@ -753,7 +711,7 @@ def wav_stream_file(filename: str, frames_to_read: int = 1024,
     filenamebytes = _get_filename_bytes(filename)
     with ffi.new("drwav*") as wav:
         if not lib.drwav_init_file(wav, filenamebytes, ffi.NULL):
-            raise DecodeError("could not open/decode file")
+            raise _file_decode_error(filename, "could not open/decode file")
         if seek_frame > 0:
             result = lib.drwav_seek_to_pcm_frame(wav, seek_frame)
             if result <= 0:
@@ -761,13 +719,15 @@ def wav_stream_file(filename: str, frames_to_read: int = 1024,
         try:
             with ffi.new("drwav_int16[]", frames_to_read * wav.channels) as decodebuffer:
                 buf_ptr = ffi.cast("drwav_int16 *", decodebuffer)
+                buf_view = memoryview(ffi.buffer(decodebuffer))
+                samples_proto = _create_int_array(2)
+                read_frames = lib.drwav_read_pcm_frames_s16
                 while True:
-                    num_samples = lib.drwav_read_pcm_frames_s16(wav, frames_to_read, buf_ptr)
+                    num_samples = read_frames(wav, frames_to_read, buf_ptr)
                     if num_samples <= 0:
                         break
-                    buffer = ffi.buffer(decodebuffer, num_samples * 2 * wav.channels)
-                    samples = _create_int_array(2)
-                    samples.frombytes(buffer)
+                    samples = array.array(samples_proto.typecode)
+                    samples.frombytes(buf_view[:num_samples * 2 * wav.channels])
                     yield samples
         finally:
             lib.drwav_uninit(wav)
@@ -782,29 +742,90 @@ def wav_write_file(filename: str, sound: DecodedSoundFile) -> None:
         fmt.sampleRate = sound.sample_rate
         fmt.bitsPerSample = sound.sample_width * 8
         # what about floating point format?
-        filename_bytes = filename.encode(sys.getfilesystemencoding())
+        filename_bytes = filename.encode(_FS_ENCODING)
         if not lib.drwav_init_file_write_sequential(pwav, filename_bytes,
                                                     fmt, sound.num_frames * sound.nchannels, ffi.NULL):
             raise IOError("can't open file for writing")
         try:
-            lib.drwav_write_pcm_frames(pwav, sound.num_frames, sound.samples.tobytes())
+            lib.drwav_write_pcm_frames(pwav, sound.num_frames, ffi.from_buffer(sound.samples))
         finally:
             lib.drwav_uninit(pwav)
 
 
+# dispatch tables keyed on the (lowercased) file extension, to avoid
+# re-doing an if/elif chain for every file in bulk workloads
+_FILE_INFO_DISPATCH = {
+    ".ogg": vorbis_get_file_info,
+    ".vorbis": vorbis_get_file_info,
+    ".mp3": mp3_get_file_info,
+    ".flac": flac_get_file_info,
+    ".wav": wav_get_file_info,
+}       # type: Dict[str, Callable[[str], SoundFileInfo]]
+
+_FILE_READ_DISPATCH = {
+    ".ogg": _read_vorbis_file,
+    ".vorbis": _read_vorbis_file,
+    ".mp3": _read_mp3_file,
+    ".flac": _read_flac_file,
+    ".wav": _read_wav_file,
+}       # type: Dict[str, Callable[[str, bool], DecodedSoundFile]]
+
+
+# maps sample width in bytes to the array.array typecode for it (platform dependent)
+_ITEMSIZE_TO_TYPECODE = {}      # type: Dict[int, str]
+for _typecode in "Bhilq":
+    _ITEMSIZE_TO_TYPECODE.setdefault(array.array(_typecode).itemsize, _typecode)
+del _typecode
+
+
 def _create_int_array(itemsize: int) -> array.array:
-    for typecode in "Bhilq":
-        a = array.array(typecode)
-        if a.itemsize == itemsize:
-            return a
-    raise ValueError("cannot create array")
+    try:
+        return array.array(_ITEMSIZE_TO_TYPECODE[itemsize])
+    except KeyError:
+        raise ValueError("cannot create array") from None
+
+
+def _samples_from_cdata(memory: ffi.CData, nbytes: int, itemsize: int, float_samples: bool = False) -> Any:
+    """Create a samples array from decoded PCM data in C memory, with a single bulk buffer copy.
+    Returns an array.array, or a numpy ndarray if the use_numpy_samples module flag is enabled."""
+    if use_numpy_samples and numpy:
+        dtype = numpy.float32 if float_samples else _NUMPY_DTYPE_FROM_WIDTH[itemsize]
+        samples = numpy.empty(nbytes // itemsize, dtype=dtype)
+        ffi.memmove(samples, memory, nbytes)        # single memcpy, no wrapper objects
+        return samples
+    samples = array.array('f') if float_samples else _create_int_array(itemsize)
+    samples.frombytes(memoryview(ffi.buffer(memory, nbytes)))
+    return samples
 
 
 def _get_filename_bytes(filename: str) -> bytes:
-    filename2 = os.path.expanduser(filename)
-    if not os.path.isfile(filename2):
-        raise FileNotFoundError(filename)
-    return filename2.encode(sys.getfilesystemencoding())
+    # no existence pre-check here: the decoder opens the file anyway, so the
+    # extra stat call is only spent when that open fails (see _file_decode_error)
+    return os.path.expanduser(filename).encode(_FS_ENCODING)
+
+
+# files smaller than this are slurped into memory with a single read and decoded
+# from there, which avoids the many small reads the decoders do on a file
+_WHOLE_FILE_READ_THRESHOLD = 64 * 1024 * 1024
+
+
+def _read_filedata(filename: str) -> Optional[bytes]:
+    try:
+        filename = os.path.expanduser(filename)
+        if os.path.getsize(filename) < _WHOLE_FILE_READ_THRESHOLD:
+            with open(filename, "rb") as f:
+                return f.read()
+    except OSError:
+        pass        # let the decoder's own file open report the problem
+    return None
+
+
+def _file_decode_error(filename: str, message: str, *args: Any) -> Exception:
+    """Returns the exception for a failed file open/decode: a FileNotFoundError
+    if the file turns out not to exist, otherwise a DecodeError."""
+    if not os.path.isfile(os.path.expanduser(filename)):
+        return FileNotFoundError(filename)
+    return DecodeError(message, *args)
 
 
 class Devices:
@@ -834,13 +855,12 @@ class Devices:
             for i in range(playback_count[0]):
                 ma_device_info = playback_infos[0][i]
                 dev_id = ffi.new("ma_device_id *", ma_device_info.id)  # copy the id memory
-                info = {
+                devs.append({
                     "name": ffi.string(ma_device_info.name).decode(),
                     "type": DeviceType.PLAYBACK,
-                    "id": dev_id
-                }
-                info.update(self._get_info(DeviceType.PLAYBACK, ma_device_info))
-                devs.append(info)
+                    "id": dev_id,
+                    "formats": self._get_formats(DeviceType.PLAYBACK, ma_device_info)
+                })
             return devs
 
     def get_captures(self) -> List[Dict[str, Any]]:
@@ -853,17 +873,16 @@ class Devices:
             for i in range(capture_count[0]):
                 ma_device_info = capture_infos[0][i]
                 dev_id = ffi.new("ma_device_id *", ma_device_info.id)  # copy the id memory
-                info = {
+                devs.append({
                     "name": ffi.string(ma_device_info.name).decode(),
                     "type": DeviceType.CAPTURE,
-                    "id": dev_id
-                }
-                info.update(self._get_info(DeviceType.CAPTURE, ma_device_info))
-                devs.append(info)
+                    "id": dev_id,
+                    "formats": self._get_formats(DeviceType.CAPTURE, ma_device_info)
+                })
             return devs
 
-    def _get_info(self, device_type: DeviceType, device_info: ffi.CData) -> Dict[str, Any]:
-        # obtain detailed info about the device
+    def _get_formats(self, device_type: DeviceType, device_info: ffi.CData) -> List[Dict[str, Any]]:
+        # obtain the native data formats of the device
         result = lib.ma_context_get_device_info(self._context, device_type.value, ffi.addressof(device_info.id), ffi.addressof(device_info))
         if result != lib.MA_SUCCESS:
             raise MiniaudioError("can't get device info")
@@ -871,72 +890,79 @@ class Devices:
         for fmt in range(device_info.nativeDataFormatCount):
             data_format = device_info.nativeDataFormats[fmt]
             formats.append({
-                "format": ffi.string(lib.ma_get_format_name(data_format.format)).decode(),
+                "format": _format_name(data_format.format),
                 "samplerate": data_format.sampleRate,
                 "channels": data_format.channels
             })
-        return {"formats": formats}
+        return formats
 
     def __del__(self):
         lib.ma_context_uninit(self._context)
 
 
+_WIDTH_FROM_FORMAT = {
+    SampleFormat.UNSIGNED8: 1,
+    SampleFormat.SIGNED16: 2,
+    SampleFormat.SIGNED24: 3,
+    SampleFormat.SIGNED32: 4,
+    SampleFormat.FLOAT32: 4
+}
+
+_ARRAY_TYPECODE_FROM_FORMAT = {
+    SampleFormat.UNSIGNED8: _ITEMSIZE_TO_TYPECODE[1],
+    SampleFormat.SIGNED16: _ITEMSIZE_TO_TYPECODE[2],
+    SampleFormat.SIGNED32: _ITEMSIZE_TO_TYPECODE[4],
+    SampleFormat.FLOAT32: 'f'
+}
+
+
 def width_from_format(sampleformat: SampleFormat) -> int:
     """returns the sample width in bytes, of the given sample format."""
-    widths = {
-        SampleFormat.UNSIGNED8: 1,
-        SampleFormat.SIGNED16: 2,
-        SampleFormat.SIGNED24: 3,
-        SampleFormat.SIGNED32: 4,
-        SampleFormat.FLOAT32: 4
-    }
-    if sampleformat in widths:
-        return widths[sampleformat]
-    raise MiniaudioError("unsupported sample format", sampleformat)
+    try:
+        return _WIDTH_FROM_FORMAT[sampleformat]
+    except KeyError:
+        raise MiniaudioError("unsupported sample format", sampleformat) from None
 
 
 def _array_proto_from_format(sampleformat: SampleFormat) -> array.array:
-    arrays = {
-        SampleFormat.UNSIGNED8: _create_int_array(1),
-        SampleFormat.SIGNED16: _create_int_array(2),
-        SampleFormat.SIGNED32: _create_int_array(4),
-        SampleFormat.FLOAT32: array.array('f')
-    }
-    if sampleformat in arrays:
-        return arrays[sampleformat]
-    raise MiniaudioError("the requested sample format can not be used directly: "
-                         + sampleformat.name + " (convert it first)")
+    try:
+        return array.array(_ARRAY_TYPECODE_FROM_FORMAT[sampleformat])
+    except KeyError:
+        raise MiniaudioError("the requested sample format can not be used directly: "
+                             + sampleformat.name + " (convert it first)") from None
+
+
+_SAMPLE_FORMAT_BY_WIDTH = {
+    1: SampleFormat.UNSIGNED8,
+    2: SampleFormat.SIGNED16,
+    3: SampleFormat.SIGNED24,
+    4: SampleFormat.SIGNED32
+}
 
 
 def _format_from_width(sample_width: int, is_float: bool = False) -> SampleFormat:
     if is_float:
         return SampleFormat.FLOAT32
-    elif sample_width == 1:
-        return SampleFormat.UNSIGNED8
-    elif sample_width == 2:
-        return SampleFormat.SIGNED16
-    elif sample_width == 3:
-        return SampleFormat.SIGNED24
-    elif sample_width == 4:
-        return SampleFormat.SIGNED32
-    else:
-        raise MiniaudioError("unsupported sample width", sample_width)
+    try:
+        return _SAMPLE_FORMAT_BY_WIDTH[sample_width]
+    except KeyError:
+        raise MiniaudioError("unsupported sample width", sample_width) from None
 
 
 def decode_file(filename: str, output_format: SampleFormat = SampleFormat.SIGNED16,
                 nchannels: int = 2, sample_rate: int = 44100, dither: DitherMode = DitherMode.NONE) -> DecodedSoundFile:
     """Convenience function to decode any supported audio file to raw PCM samples in your chosen format."""
     sample_width = width_from_format(output_format)
-    samples = _array_proto_from_format(output_format)
+    _array_proto_from_format(output_format)     # just validates that the format can be used directly
     filenamebytes = _get_filename_bytes(filename)
     with ffi.new("ma_uint64 *") as frames, ffi.new("void **") as memory:
         decoder_config = lib.ma_decoder_config_init(output_format.value, nchannels, sample_rate)
         decoder_config.ditherMode = dither.value
         result = lib.ma_decode_file(filenamebytes, ffi.addressof(decoder_config), frames, memory)
         if result != lib.MA_SUCCESS:
-            raise DecodeError("failed to decode file", result)
-        buffer = ffi.buffer(memory[0], frames[0] * nchannels * sample_width)
-        samples.frombytes(buffer)
+            raise _file_decode_error(filename, "failed to decode file", result)
+        samples = _samples_from_cdata(memory[0], frames[0] * nchannels * sample_width, sample_width,
+                                      output_format == SampleFormat.FLOAT32)
         lib.ma_free(memory[0], ffi.NULL)
         return DecodedSoundFile(filename, nchannels, sample_rate, output_format, samples)
 
@@ -945,22 +971,22 @@ def decode(data: bytes, output_format: SampleFormat = SampleFormat.SIGNED16,
            nchannels: int = 2, sample_rate: int = 44100, dither: DitherMode = DitherMode.NONE) -> DecodedSoundFile:
     """Convenience function to decode any supported audio file in memory to raw PCM samples in your chosen format."""
     sample_width = width_from_format(output_format)
-    samples = _array_proto_from_format(output_format)
+    _array_proto_from_format(output_format)     # just validates that the format can be used directly
     with ffi.new("ma_uint64 *") as frames, ffi.new("void **") as memory:
         decoder_config = lib.ma_decoder_config_init(output_format.value, nchannels, sample_rate)
         decoder_config.ditherMode = dither.value
         result = lib.ma_decode_memory(data, len(data), ffi.addressof(decoder_config), frames, memory)
         if result != lib.MA_SUCCESS:
             raise DecodeError("failed to decode data", result)
-        buffer = ffi.buffer(memory[0], frames[0] * nchannels * sample_width)
-        samples.frombytes(buffer)
+        samples = _samples_from_cdata(memory[0], frames[0] * nchannels * sample_width, sample_width,
+                                      output_format == SampleFormat.FLOAT32)
         lib.ma_free(memory[0], ffi.NULL)
         return DecodedSoundFile("<memory>", nchannels, sample_rate, output_format, samples)
 
 
 def _samples_stream_generator(frames_to_read: int, nchannels: int, output_format: SampleFormat,
-                              decoder: ffi.CData, data: Any,
-                              on_close: Optional[Callable] = None) -> Generator[array.array, int, None]:
+                              decoder: ffi.CData, data: Any, on_close: Optional[Callable] = None,
+                              raw: bool = False) -> Generator[Union[array.array, memoryview], int, None]:
     _reference = data    # make sure any data passed in is not garbage collected
     sample_width = width_from_format(output_format)
     samples_proto = _array_proto_from_format(output_format)
@@ -968,14 +994,19 @@ def _samples_stream_generator(frames_to_read: int, nchannels: int, output_format
     try:
         with ffi.new("int8_t[]", allocated_buffer_frames * nchannels * sample_width) as decodebuffer:
             buf_ptr = ffi.cast("void *", decodebuffer)
-            want_frames = (yield samples_proto) or frames_to_read
+            buf_view = memoryview(ffi.buffer(decodebuffer))
+            typecode = samples_proto.typecode
+            want_frames = (yield buf_view[:0] if raw else samples_proto) or frames_to_read
             source = None     # type: Optional[StreamableSource]
             if decoder.pUserData != ffi.NULL:
                 source = ffi.from_handle(decoder.pUserData)
             while True:
                 if want_frames > allocated_buffer_frames:
-                    raise MiniaudioError("wanted to read more frames than storage was allocated for ({} vs {})"
-                                         .format(want_frames, allocated_buffer_frames))
+                    # grow the decode buffer to fit the larger request (it is never shrunk again)
+                    allocated_buffer_frames = want_frames
+                    decodebuffer = ffi.new("int8_t[]", allocated_buffer_frames * nchannels * sample_width)
+                    buf_ptr = ffi.cast("void *", decodebuffer)
+                    buf_view = memoryview(ffi.buffer(decodebuffer))
                 num_frames = 0
                 with ffi.new("ma_uint64 *") as frames_read:
                     try:
@@ -993,10 +1024,14 @@ def _samples_stream_generator(frames_to_read: int, nchannels: int, output_format
                     break
                 if source and source.error_in_readcallback:
                     raise DecodeError("error in read callback") from source.error_in_readcallback
-                buffer = ffi.buffer(decodebuffer, num_frames * sample_width * nchannels)
-                samples = array.array(samples_proto.typecode)
-                samples.frombytes(buffer)
-                want_frames = (yield samples) or frames_to_read
+                nbytes = num_frames * sample_width * nchannels
+                if raw:
+                    # yield a view straight over the decode buffer; only valid until the next iteration
+                    want_frames = (yield buf_view[:nbytes]) or frames_to_read
+                else:
+                    samples = array.array(typecode)
+                    samples.frombytes(buf_view[:nbytes])
+                    want_frames = (yield samples) or frames_to_read
     finally:
         if on_close:
             on_close()
@@ -1005,7 +1040,8 @@ def _samples_stream_generator(frames_to_read: int, nchannels: int, output_format
 
 def stream_file(filename: str, output_format: SampleFormat = SampleFormat.SIGNED16, nchannels: int = 2,
                 sample_rate: int = 44100, frames_to_read: int = 1024,
-                dither: DitherMode = DitherMode.NONE, seek_frame: int = 0) -> Generator[array.array, int, None]:
+                dither: DitherMode = DitherMode.NONE, seek_frame: int = 0,
+                raw: bool = False) -> Generator[Union[array.array, memoryview], int, None]:
     """
     Convenience generator function to decode and stream any supported audio file
     as chunks of raw PCM samples in the chosen format.
@@ -1013,6 +1049,8 @@ def stream_file(filename: str, output_format: SampleFormat = SampleFormat.SIGNED
     you'll get that given number of frames, instead of the default configured amount.
     This is particularly useful to plug this stream into an audio device callback that
     wants a variable number of frames per call.
+    With raw enabled, chunks are yielded as memoryviews over the decoder's reused buffer
+    (skipping a copy per chunk); such a view is only valid until the next iteration.
     """
     filenamebytes = _get_filename_bytes(filename)
     decoder = ffi.new("ma_decoder *")
@@ -1020,12 +1058,12 @@ def stream_file(filename: str, output_format: SampleFormat = SampleFormat.SIGNED
     decoder_config.ditherMode = dither.value
     result = lib.ma_decoder_init_file(filenamebytes, ffi.addressof(decoder_config), decoder)
     if result != lib.MA_SUCCESS:
-        raise DecodeError("failed to init decoder", result)
+        raise _file_decode_error(filename, "failed to init decoder", result)
     if seek_frame > 0:
         result = lib.ma_decoder_seek_to_pcm_frame(decoder, seek_frame)
         if result != lib.MA_SUCCESS:
             raise DecodeError("failed to seek to frame", result)
-    g = _samples_stream_generator(frames_to_read, nchannels, output_format, decoder, None)
+    g = _samples_stream_generator(frames_to_read, nchannels, output_format, decoder, None, raw=raw)
     dummy = next(g)
     assert len(dummy) == 0
     return g
@@ -1033,7 +1071,8 @@ def stream_file(filename: str, output_format: SampleFormat = SampleFormat.SIGNED
 
 def stream_memory(data: bytes, output_format: SampleFormat = SampleFormat.SIGNED16, nchannels: int = 2,
                   sample_rate: int = 44100, frames_to_read: int = 1024,
-                  dither: DitherMode = DitherMode.NONE) -> Generator[array.array, int, None]:
+                  dither: DitherMode = DitherMode.NONE,
+                  raw: bool = False) -> Generator[Union[array.array, memoryview], int, None]:
     """
     Convenience generator function to decode and stream any supported audio file in memory
     as chunks of raw PCM samples in the chosen format.
@@ -1041,6 +1080,8 @@ def stream_memory(data: bytes, output_format: SampleFormat = SampleFormat.SIGNED
     you'll get that given number of frames, instead of the default configured amount.
     This is particularly useful to plug this stream into an audio device callback that
     wants a variable number of frames per call.
+    With raw enabled, chunks are yielded as memoryviews over the decoder's reused buffer
+    (skipping a copy per chunk); such a view is only valid until the next iteration.
     """
     decoder = ffi.new("ma_decoder *")
     decoder_config = lib.ma_decoder_config_init(output_format.value, nchannels, sample_rate)
@@ -1048,7 +1089,7 @@ def stream_memory(data: bytes, output_format: SampleFormat = SampleFormat.SIGNED
     result = lib.ma_decoder_init_memory(data, len(data), ffi.addressof(decoder_config), decoder)
     if result != lib.MA_SUCCESS:
         raise DecodeError("failed to init decoder", result)
-    g = _samples_stream_generator(frames_to_read, nchannels, output_format, decoder, data)
+    g = _samples_stream_generator(frames_to_read, nchannels, output_format, decoder, data, raw=raw)
     dummy = next(g)
     assert len(dummy) == 0
     return g
@@ -1339,7 +1380,10 @@ def _internal_data_callback(device: ffi.CData, output: ffi.CData, input: ffi.CDa
     if framecount <= 0 or not device.pUserData:
         return
     callback_device = ffi.from_handle(device.pUserData)
-    callback_device._data_callback(device, output, input, framecount)
+    callback = callback_device._bound_data_callback
+    if callback is None:
+        return      # device is shutting down
+    callback(device, output, input, framecount)
 
 
 @ffi.def_extern()
@@ -1353,9 +1397,12 @@ def _internal_stop_callback(device: ffi.CData) -> None:
 class AbstractDevice:
     def __init__(self) -> None:
         self.callback_generator = None          # type: Optional[GeneratorTypes]
+        self._send = None                       # type: Optional[Callable]
         self.running = False
         self.stop_callback = None               # doesn't work consistently
         self._device = ffi.new("ma_device *")
+        # pre-bound once, so the audio callback doesn't create a new method object every call
+        self._bound_data_callback = self._data_callback     # type: Optional[Callable]
 
     def __del__(self) -> None:
         self.close()
@@ -1370,9 +1417,12 @@ class AbstractDevice:
         """Start playback or capture, using the given callback generator (should already been started)"""
         if self.callback_generator:
             raise MiniaudioError("can't start an already started device")
+        import inspect      # deferred import; only needed when actually starting a device
         if not inspect.isgenerator(callback_generator):
             raise TypeError("callback must be a generator", type(callback_generator))
         self.callback_generator = callback_generator
+        # pre-bind the generator's send method, to skip the method lookup on every audio callback
+        self._send = callback_generator.send
         result = lib.ma_device_start(self._device)
         if result != lib.MA_SUCCESS:
             raise MiniaudioError("failed to start audio device", result)
@@ -1381,6 +1431,7 @@ class AbstractDevice:
     def stop(self) -> None:
         """Halt playback or capture."""
         self.callback_generator = None
+        self._send = None
         if self.running:
             result = lib.ma_device_stop(self._device)
             if result != lib.MA_SUCCESS:
@@ -1396,7 +1447,11 @@ class AbstractDevice:
             self.stop()
         except MiniaudioError:
             pass
+        self._bound_data_callback = None
         if self._device is not None:
+            # clear the userdata pointer so a callback still in flight can't
+            # dereference the handle once this device is being torn down
+            self._device.pUserData = ffi.NULL
             lib.ma_device_uninit(self._device)
             self._device = None
         self.stop_callback = None
@@ -1407,6 +1462,7 @@ class AbstractDevice:
             self.running = False
             self.stop_callback()
             self.callback_generator = None
+            self._send = None
 
     def _make_context(self, backends: List[Backend], thread_prio: ThreadPriority = ThreadPriority.HIGHEST,
                       app_name: str = "") -> ffi.CData:
@@ -1437,8 +1493,10 @@ class CaptureDevice(AbstractDevice):
     def __init__(self, input_format: SampleFormat = SampleFormat.SIGNED16, nchannels: int = 2,
                  sample_rate: int = 44100, buffersize_msec: int = 200, device_id: Union[ffi.CData, None] = None,
                  callback_periods: int = 0, backends: Optional[List[Backend]] = None,
-                 thread_prio: ThreadPriority = ThreadPriority.HIGHEST, app_name: str = "") -> None:
+                 thread_prio: ThreadPriority = ThreadPriority.HIGHEST, app_name: str = "",
+                 zero_copy: bool = False) -> None:
         super().__init__()
+        self.zero_copy = zero_copy
         self.format = input_format
         self.sample_width = width_from_format(input_format)
         self.nchannels = nchannels
@@ -1456,6 +1514,9 @@ class CaptureDevice(AbstractDevice):
         self._devconfig.stopCallback = lib._internal_stop_callback
         self._devconfig.periods = callback_periods
         self.callback_generator = None  # type: Optional[CaptureCallbackGeneratorType]
+        # reusable capture buffer, to avoid allocating a fresh one on the audio thread for every callback
+        self._scratch_buffer = bytearray()
+        self._scratch_view = memoryview(self._scratch_buffer)
         self._context = self._make_context(backends or [], thread_prio, app_name)
         result = lib.ma_device_init(self._context, ffi.addressof(self._devconfig), self._device)
         if result != lib.MA_SUCCESS:
@@ -1467,22 +1528,36 @@ class CaptureDevice(AbstractDevice):
 
     def start(self, callback_generator: CaptureCallbackGeneratorType) -> None:      # type: ignore
         """Start the audio device: capture (recording) begins.
-        The recorded audio data is sent to the given callback generator as raw bytes.
-        (it should already be started before)"""
+        The recorded audio data is sent to the given callback generator as a memoryview that
+        is only valid until the next callback; copy it (for instance with bytes(data))
+        if you want to keep it around.  With zero_copy enabled the view wraps the device's
+        own buffer and must be fully consumed before the callback returns.
+        (the generator should already be started before)"""
         return super().start(callback_generator)
 
     def _data_callback(self, device: ffi.CData, output: ffi.CData, input: ffi.CData, framecount: int) -> None:
-        if self.callback_generator:
+        send = self._send
+        if send is not None:
             buffer_size = self.sample_width * self.nchannels * framecount
-            data = bytearray(buffer_size)
-            ffi.memmove(data, input, buffer_size)
+            if self.zero_copy:
+                # wrap miniaudio's own input buffer, without copying out of it
+                data = memoryview(ffi.buffer(input, buffer_size))
+            else:
+                if buffer_size > len(self._scratch_buffer):
+                    # grow the reusable capture buffer (it never shrinks)
+                    self._scratch_buffer = bytearray(buffer_size)
+                    self._scratch_view = memoryview(self._scratch_buffer)
+                ffi.memmove(self._scratch_view, input, buffer_size)
+                data = self._scratch_view[:buffer_size]
             try:
-                self.callback_generator.send(data)
+                send(data)
             except StopIteration:
                 self.callback_generator = None
+                self._send = None
                 return
             except Exception:
                 self.callback_generator = None
+                self._send = None
                 raise
 
 
@@ -1491,8 +1566,10 @@ class PlaybackDevice(AbstractDevice):
     def __init__(self, output_format: SampleFormat = SampleFormat.SIGNED16, nchannels: int = 2,
                  sample_rate: int = 44100, buffersize_msec: int = 200, device_id: Union[ffi.CData, None] = None,
                  callback_periods: int = 0, backends: Optional[List[Backend]] = None,
-                 thread_prio: ThreadPriority = ThreadPriority.HIGHEST, app_name: str = "") -> None:
+                 thread_prio: ThreadPriority = ThreadPriority.HIGHEST, app_name: str = "",
+                 write_mode: bool = False) -> None:
         super().__init__()
+        self.write_mode = write_mode
         self.format = output_format
         self.sample_width = width_from_format(output_format)
         self.nchannels = nchannels
@@ -1524,25 +1601,55 @@ class PlaybackDevice(AbstractDevice):
         """Start the audio device: playback begins. The audio data is provided by the given callback generator.
         The generator gets sent the required number of frames and should yield the sample data
         as raw bytes, a memoryview, an array.array, or as a numpy array with shape (numframes, numchannels).
+        With write_mode enabled the generator is instead sent a (buffer, framecount) tuple and should
+        write the sample data into the given buffer memoryview itself; the buffer is zero-filled
+        beforehand and is only valid for the duration of that callback.
         The generator should already be started before passing it in."""
         return super().start(callback_generator)
 
     def _data_callback(self, device: ffi.CData, output: ffi.CData, input: ffi.CData, framecount: int) -> None:
-        if self.callback_generator:
+        send = self._send
+        if send is not None:
+            if self.write_mode:
+                # hand the generator a view over the device's own output buffer to fill in place
+                out_view = memoryview(ffi.buffer(output, framecount * self.sample_width * self.nchannels))
+                try:
+                    send((out_view, framecount))
+                except StopIteration:
+                    self.callback_generator = None
+                    self._send = None
+                except Exception:
+                    self.callback_generator = None
+                    self._send = None
+                    raise
+                return
             try:
-                samples = self.callback_generator.send(framecount)
+                samples = send(framecount)
             except StopIteration:
                 self.callback_generator = None
+                self._send = None
                 return
             except Exception:
                 self.callback_generator = None
+                self._send = None
                 raise
-            samples_bytes = _bytes_from_generator_samples(samples)
-            if samples_bytes:
-                if len(samples_bytes) > framecount * self.sample_width * self.nchannels:
+            # common sample containers support the buffer protocol, so they can be
+            # memmoved into the output directly without converting to bytes first
+            if isinstance(samples, array.array):
+                nbytes = len(samples) * samples.itemsize
+            elif isinstance(samples, memoryview):
+                nbytes = samples.nbytes
+            elif isinstance(samples, (bytes, bytearray)):
+                nbytes = len(samples)
+            else:
+                samples = _bytes_from_generator_samples(samples)
+                nbytes = len(samples)
+            if nbytes:
+                if nbytes > framecount * self.sample_width * self.nchannels:
                     self.callback_generator = None
+                    self._send = None
                     raise MiniaudioError("number of frames from callback exceeds maximum")
-                ffi.memmove(output, samples_bytes, len(samples_bytes))
+                ffi.memmove(output, samples, nbytes)
 
 
 class DuplexStream(AbstractDevice):
@@ -1552,8 +1659,11 @@ class DuplexStream(AbstractDevice):
                  capture_channels: int = 2, sample_rate: int = 44100, buffersize_msec: int = 200,
                  playback_device_id: Union[ffi.CData, None] = None, capture_device_id: Union[ffi.CData, None] = None,
                  callback_periods: int = 0, backends: Optional[List[Backend]] = None,
-                 thread_prio: ThreadPriority = ThreadPriority.HIGHEST, app_name: str = "") -> None:
+                 thread_prio: ThreadPriority = ThreadPriority.HIGHEST, app_name: str = "",
+                 zero_copy: bool = False, needs_capture: bool = True) -> None:
         super().__init__()
+        self.zero_copy = zero_copy
+        self.needs_capture = needs_capture
         self.capture_format = capture_format
         self.playback_format = playback_format
         self.sample_width = width_from_format(capture_format)
@@ -1576,6 +1686,9 @@ class DuplexStream(AbstractDevice):
         self._devconfig.stopCallback = lib._internal_stop_callback
         self._devconfig.periods = callback_periods
         self.callback_generator = None  # type: Optional[DuplexCallbackGeneratorType]
+        # reusable capture buffer, to avoid allocating a fresh one on the audio thread for every callback
+        self._scratch_buffer = bytearray()
+        self._scratch_view = memoryview(self._scratch_buffer)
         self._context = self._make_context(backends or [], thread_prio, app_name)
         result = lib.ma_device_init(self._context, ffi.addressof(self._devconfig), self._device)
         if result != lib.MA_SUCCESS:
@@ -1588,26 +1701,44 @@ class DuplexStream(AbstractDevice):
     def start(self, callback_generator: DuplexCallbackGeneratorType) -> None:       # type: ignore
         """Start the audio device: playback and capture begin.
         The audio data for playback is provided by the given callback generator, which is sent the
-        recorded audio data at the same time.
-        (it should already be started before passing it in)"""
+        recorded audio data at the same time.  The recorded data is a memoryview that is only
+        valid until the next callback; copy it (for instance with bytes(data)) if you want to
+        keep it around.  If the device was created with needs_capture=False, the generator is
+        sent None instead and the recorded data is not copied out of the device at all.
+        (the generator should already be started before passing it in)"""
         return super().start(callback_generator)
 
     def _data_callback(self, device: ffi.CData, output: ffi.CData, input: ffi.CData, framecount: int) -> None:
-        buffer_size = self.sample_width * self.capture_channels * framecount
-        in_data = bytearray(buffer_size)
-        ffi.memmove(in_data, input, buffer_size)
-        if self.callback_generator:
-            try:
-                out_data = self.callback_generator.send(in_data)
-            except StopIteration:
-                self.callback_generator = None
-                return
-            except Exception:
-                self.callback_generator = None
-                raise
-            if out_data:
-                samples_bytes = _bytes_from_generator_samples(out_data)
-                ffi.memmove(output, samples_bytes, len(samples_bytes))
+        send = self._send
+        if send is None:
+            return
+        if not self.needs_capture:
+            in_data = None      # type: Union[memoryview, None]    # generator ignores the recorded data, skip the copy
+        else:
+            buffer_size = self.sample_width * self.capture_channels * framecount
+            if self.zero_copy:
+                # wrap miniaudio's own input buffer, without copying out of it
+                in_data = memoryview(ffi.buffer(input, buffer_size))
+            else:
+                if buffer_size > len(self._scratch_buffer):
+                    # grow the reusable capture buffer (it never shrinks)
+                    self._scratch_buffer = bytearray(buffer_size)
+                    self._scratch_view = memoryview(self._scratch_buffer)
+                ffi.memmove(self._scratch_view, input, buffer_size)
+                in_data = self._scratch_view[:buffer_size]
+        try:
+            out_data = send(in_data)
+        except StopIteration:
+            self.callback_generator = None
+            self._send = None
+            return
+        except Exception:
+            self.callback_generator = None
+            self._send = None
+            raise
+        if out_data:
+            samples_bytes = _bytes_from_generator_samples(out_data)
+            ffi.memmove(output, samples_bytes, len(samples_bytes))
 
 
 def _bytes_from_generator_samples(samples: Union[array.array, memoryview, bytes]) -> bytes:
@@ -1648,7 +1779,7 @@ class WavFileReadStream(io.RawIOBase):
         else:
             lib.drwav_init_memory_write(pwav, data, datasize, fmt, ffi.NULL)
         lib.drwav_uninit(pwav)
-        self.buffered = bytes(ffi.buffer(data[0], datasize[0]))
+        self.buffered = bytearray(ffi.buffer(data[0], datasize[0]))
         lib.drwav_free(data[0], ffi.NULL)
 
     def read(self, amount: int = sys.maxsize) -> Optional[bytes]:
@@ -1662,9 +1793,13 @@ class WavFileReadStream(io.RawIOBase):
                 self.bytes_done = sys.maxsize
                 break
             else:
-                self.buffered += _bytes_from_generator_samples(samples)
-        result = self.buffered[:amount]
-        self.buffered = self.buffered[amount:]
+                self.buffered.extend(_bytes_from_generator_samples(samples))
+        with memoryview(self.buffered) as view, view[:amount] as chunk:
+            # slice through a memoryview so only the returned bytes are copied,
+            # not an intermediate bytearray as well; both views are released
+            # deterministically, so trimming the buffer below is safe on any interpreter
+            result = bytes(chunk)
+        del self.buffered[:amount]
         self.bytes_done += len(result)
         return result
 
@@ -1,3 +1,4 @@
+import pytest
 import miniaudio
 from unittest import mock
 
@@ -110,6 +111,55 @@ def load_sample(name):
         return f.read()
 
 
+def test_numpy_samples():
+    numpy = pytest.importorskip("numpy")
+    data = load_sample("music.wav")
+    miniaudio.use_numpy_samples = True
+    try:
+        sound = miniaudio.wav_read_s16(data)
+    finally:
+        miniaudio.use_numpy_samples = False
+    assert isinstance(sound.samples, numpy.ndarray)
+    assert sound.samples.dtype == numpy.int16
+    assert sound.num_frames > 200000
+    reference = miniaudio.wav_read_s16(data)
+    assert sound.samples.tobytes() == reference.samples.tobytes()
+
+
+def test_numpy_samples_unsigned8():
+    numpy = pytest.importorskip("numpy")
+    data = load_sample("music.wav")
+    miniaudio.use_numpy_samples = True
+    try:
+        sound = miniaudio.decode(data, output_format=miniaudio.SampleFormat.UNSIGNED8)
+    finally:
+        miniaudio.use_numpy_samples = False
+    assert isinstance(sound.samples, numpy.ndarray)
+    assert sound.samples.dtype == numpy.uint8
+    reference = miniaudio.decode(data, output_format=miniaudio.SampleFormat.UNSIGNED8)
+    assert reference.samples.typecode == 'B'
+    assert sound.samples.tobytes() == reference.samples.tobytes()
+    assert sound.samples.tolist() == reference.samples.tolist()     # values must agree, not just the raw bytes
+
+
+def test_read_files():
+    filenames = ["examples/samples/music.wav", "examples/samples/music.flac"]
+    sounds = miniaudio.read_files(filenames)
+    assert len(sounds) == 2
+    assert sounds[0].name == filenames[0]
+    assert sounds[1].name == filenames[1]
+    assert all(sound.num_frames > 200000 for sound in sounds)
+
+
+def test_read_files_async():
+    import asyncio
+    filenames = ["examples/samples/music.wav", "examples/samples/music.flac"]
+    sounds = asyncio.run(miniaudio.read_files_async(filenames))
+    assert len(sounds) == 2
+    assert sounds[0].name == filenames[0]
+    assert all(sound.num_frames > 200000 for sound in sounds)
+
+
 def test_file_info():
     info = miniaudio.get_file_info("examples/samples/music.ogg")
     assert info.file_format == miniaudio.FileFormat.VORBIS
@@ -236,6 +286,26 @@ def test_wav_read():
     assert sound.sample_rate == 22050
 
 
+def test_stream_memory_large_request():
+    data = load_sample("music.flac")
+    stream = miniaudio.stream_memory(data)
+    samples = stream.send(50000)
+    assert len(samples) == 50000 * 2
+    stream.close()
+
+
+def test_stream_memory_raw():
+    data = load_sample("music.flac")
+    stream = miniaudio.stream_memory(data, frames_to_read=256)
+    raw_stream = miniaudio.stream_memory(data, frames_to_read=256, raw=True)
+    chunk = next(stream)
+    raw_chunk = next(raw_stream)
+    assert isinstance(raw_chunk, memoryview)
+    assert bytes(raw_chunk) == memoryview(chunk).cast('B').tobytes()
+    stream.close()
+    raw_stream.close()
+
+
 def test_decode():
     data = load_sample("music.ogg")
     decoded = miniaudio.decode(data, miniaudio.SampleFormat.FLOAT32, sample_rate=32000, dither=miniaudio.DitherMode.TRIANGLE)